@@ -74,28 +74,23 @@ public class CubicSplineInterpolator : IInterpolator
         for (int i = 0; i < n - 1; i++)
             h[i] = _x[i + 1] - _x[i];
 
-        double[] alpha = new double[n - 1];
-        for (int i = 1; i < n - 1; i++)
-            alpha[i] = (3.0 / h[i]) * (_a[i + 1] - _a[i]) - (3.0 / h[i - 1]) * (_a[i] - _a[i - 1]);
-
-        // Solve tridiagonal system for c (second derivatives / 2)
-        double[] l = new double[n];
+        // Solve tridiagonal system for c (second derivatives / 2) with the Thomas algorithm.
+        // Only the forward-sweep coefficients mu and z are needed for back substitution.
         double[] mu = new double[n];
         double[] z = new double[n];
 
         // Natural spline: c[0] = c[n-1] = 0 (second derivative = 0 at boundaries)
-        l[0] = 1;
         mu[0] = 0;
         z[0] = 0;
 
         for (int i = 1; i < n - 1; i++)
         {
-            l[i] = 2 * (_x[i + 1] - _x[i - 1]) - h[i - 1] * mu[i - 1];
-            mu[i] = h[i] / l[i];
-            z[i] = (alpha[i] - h[i - 1] * z[i - 1]) / l[i];
+            double alpha = (3.0 / h[i]) * (_a[i + 1] - _a[i]) - (3.0 / h[i - 1]) * (_a[i] - _a[i - 1]);
+            double l = 2 * (_x[i + 1] - _x[i - 1]) - h[i - 1] * mu[i - 1];
+            mu[i] = h[i] / l;
+            z[i] = (alpha - h[i - 1] * z[i - 1]) / l;
         }
 
-        l[n - 1] = 1;
         z[n - 1] = 0;
         _c[n - 1] = 0;
 
@@ -119,14 +114,11 @@ public class CubicSplineInterpolator : IInterpolator
         if (t >= _x[n - 1])
             return _y[n - 1];
 
-        // Find the interval containing t
-        int i = 0;
-        while (i < n - 1 && _x[i + 1] < t)
-            i++;
+        int i = FindInterval(t);
 
-        // Evaluate cubic polynomial
+        // Evaluate cubic polynomial (Horner form)
         double dx = t - _x[i];
-        return _a[i] + _b[i] * dx + _c[i] * dx * dx + _d[i] * dx * dx * dx;
+        return _a[i] + dx * (_b[i] + dx * (_c[i] + dx * _d[i]));
     }
 
     /// <summary>
@@ -139,11 +131,18 @@ public class CubicSplineInterpolator : IInterpolator
         if (t <= _x[0] || t >= _x[n - 1])
             return 0; // Natural boundary condition
 
-        int i = 0;
-        while (i < n - 1 && _x[i + 1] < t)
-            i++;
+        int i = FindInterval(t);
 
         double dx = t - _x[i];
         return 2 * _c[i] + 6 * _d[i] * dx;
     }
+
+    /// <summary>
+    /// Finds the spline segment i with x[i] &lt;= t &lt; x[i+1] for t inside the knot range.
+    /// </summary>
+    private int FindInterval(double t)
+    {
+        int i = Array.BinarySearch(_x, t);
+        return i >= 0 ? i : ~i - 1;
+    }
 }
@@ -7,6 +7,7 @@ public class LinearInterpolator : IInterpolator
 {
     private readonly double[] _times;
     private readonly double[] _values;
+    private readonly double[] _slopes;
 
     public LinearInterpolator(double[] times, double[] values)
     {
@@ -15,6 +16,11 @@ public class LinearInterpolator : IInterpolator
 
         _times = times;
         _values = values;
+
+        // Precompute segment slopes so each lookup is a single multiply-add
+        _slopes = new double[Math.Max(times.Length - 1, 0)];
+        for (int i = 0; i < _slopes.Length; i++)
+            _slopes[i] = (values[i + 1] - values[i]) / (times[i + 1] - times[i]);
     }
 
     public double Interpolate(double t)
@@ -32,18 +38,14 @@ public class LinearInterpolator : IInterpolator
         if (t >= _times[^1])
             return _values[^1];
 
-        // Find the interval containing t
-        int i = 0;
-        while (i < _times.Length - 1 && _times[i + 1] < t)
-            i++;
+        // Find the interval containing t (times are sorted)
+        int i = Array.BinarySearch(_times, t);
+        if (i >= 0)
+            return _values[i]; // Exact knot
 
-        // Linear interpolation
-        double t1 = _times[i];
-        double t2 = _times[i + 1];
-        double v1 = _values[i];
-        double v2 = _values[i + 1];
+        i = ~i - 1;
 
-        double weight = (t - t1) / (t2 - t1);
-        return v1 + weight * (v2 - v1);
+        // Linear interpolation
+        return _values[i] + _slopes[i] * (t - _times[i]);
     }
 }
@@ -1,4 +1,5 @@
 using SwapPricer.Interpolation;
+using SwapPricer.Utils;
 
 namespace SwapPricer.Models;
 
@@ -22,6 +23,13 @@ public class Curve
         _zeroRates = new List<double>();
     }
 
+    private Curve(DateTime referenceDate, List<double> times, List<double> zeroRates)
+    {
+        ReferenceDate = referenceDate;
+        _times = times;
+        _zeroRates = zeroRates;
+    }
+
     /// <summary>
     /// Adds a zero rate point to the curve.
     /// </summary>
@@ -79,11 +87,12 @@ public class Curve
         if (t2 <= t1)
             throw new ArgumentException("t2 must be greater than t1.");
 
-        double df1 = GetDiscountFactor(t1);
-        double df2 = GetDiscountFactor(t2);
+        // DF1 / DF2 - 1 = expm1(r2 * t2 - r1 * t1); expm1 avoids cancellation for short periods
+        double rt1 = t1 <= 0 ? 0.0 : GetZeroRate(t1) * t1;
+        double rt2 = t2 <= 0 ? 0.0 : GetZeroRate(t2) * t2;
         double tau = t2 - t1;
 
-        return (df1 / df2 - 1.0) / tau;
+        return MathUtils.ExpM1(rt2 - rt1) / tau;
     }
 
     /// <summary>
@@ -92,14 +101,15 @@ public class Curve
     public Curve ShiftParallel(double shiftBps)
     {
         double shift = shiftBps / 10000.0;
-        var shiftedCurve = new Curve(ReferenceDate);
 
-        for (int i = 0; i < _times.Count; i++)
+        // Points are already sorted, so copy them across instead of re-inserting one by one
+        var shiftedRates = new List<double>(_zeroRates.Count);
+        foreach (var rate in _zeroRates)
         {
-            shiftedCurve.AddPoint(_times[i], _zeroRates[i] + shift);
+            shiftedRates.Add(rate + shift);
         }
 
-        return shiftedCurve;
+        return new Curve(ReferenceDate, new List<double>(_times), shiftedRates);
     }
 
     /// <summary>
@@ -107,12 +117,7 @@ public class Curve
     /// </summary>
     public Curve Clone()
     {
-        var clone = new Curve(ReferenceDate);
-        for (int i = 0; i < _times.Count; i++)
-        {
-            clone.AddPoint(_times[i], _zeroRates[i]);
-        }
-        return clone;
+        return new Curve(ReferenceDate, new List<double>(_times), new List<double>(_zeroRates));
     }
 
     /// <summary>
@@ -10,10 +10,24 @@ public class Swap
     public DateTime StartDate { get; }
     public DateTime EndDate { get; }
     public double Notional { get; }
-    public double FixedRate { get; set; }
     public int FixedFrequencyMonths { get; } = 12;  // Annual
     public int FloatFrequencyMonths { get; } = 6;   // Semi-annual
 
+    // Schedules are generated on first use and reused across pricings
+    private double _fixedRate;
+    private List<CashFlow>? _fixedLegCashFlows;
+    private List<FloatPeriod>? _floatLegPeriods;
+
+    public double FixedRate
+    {
+        get => _fixedRate;
+        set
+        {
+            _fixedRate = value;
+            _fixedLegCashFlows = null; // Amounts depend on the fixed rate
+        }
+    }
+
     public Swap(DateTime startDate, DateTime endDate, double notional, double fixedRate = 0.0)
     {
         StartDate = startDate;
@@ -27,10 +41,26 @@ public class Swap
     /// </summary>
     public double TenorYears => DateUtils.YearFraction(StartDate, EndDate);
 
+    /// <summary>
+    /// Gets fixed leg cash flows.
+    /// </summary>
+    public IReadOnlyList<CashFlow> GetFixedLegCashFlows()
+    {
+        return _fixedLegCashFlows ??= BuildFixedLegCashFlows();
+    }
+
+    /// <summary>
+    /// Gets floating leg periods (rates to be determined from curve).
+    /// </summary>
+    public IReadOnlyList<FloatPeriod> GetFloatLegPeriods()
+    {
+        return _floatLegPeriods ??= BuildFloatLegPeriods();
+    }
+
     /// <summary>
     /// Generates fixed leg cash flows.
     /// </summary>
-    public List<CashFlow> GetFixedLegCashFlows()
+    private List<CashFlow> BuildFixedLegCashFlows()
     {
         var cashFlows = new List<CashFlow>();
         var payDates = DateUtils.GeneratePaymentDates(StartDate, EndDate, FixedFrequencyMonths);
@@ -48,9 +78,9 @@ public class Swap
     }
 
     /// <summary>
-    /// Generates floating leg periods (rates to be determined from curve).
+    /// Generates floating leg periods.
     /// </summary>
-    public List<FloatPeriod> GetFloatLegPeriods()
+    private List<FloatPeriod> BuildFloatLegPeriods()
     {
         var periods = new List<FloatPeriod>();
         var payDates = DateUtils.GeneratePaymentDates(StartDate, EndDate, FloatFrequencyMonths);
@@ -1,3 +1,4 @@
+using System.Text;
 using SwapPricer.Models;
 using SwapPricer.Services;
 using SwapPricer.Interpolation;
@@ -27,182 +28,213 @@ class Program
     private const double DiscountSpreadBps = -38.0;
     private const double Notional = 1_000_000.0;
     private const int SwapTenorYears = 9;
-    private static StreamWriter? _fileWriter;
+    private static readonly string Separator = new('=', 70);
+
+    // Static report text
+    private static readonly string[] CurveConventions =
+    {
+        "Float leg: semi-annual reset/pay",
+        "Fixed leg: annual pay",
+        "Day count: Actual/Actual",
+        "Business day adjustment: None",
+        "Spot lag: Zero",
+    };
+
+    private static readonly string[] SplineBoundaryConditions =
+    {
+        "  f(0) = f(6M)",
+        "  f''(0) = f''(10Y) = 0",
+    };
+
+    private static readonly StringBuilder _report = new();
 
     static void Main(string[] args)
     {
-        // Create output file
         string outputPath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "..", "..", "..", "..", "Results.txt");
         outputPath = Path.GetFullPath(outputPath);
 
-        using (_fileWriter = new StreamWriter(outputPath))
-        {
-            WriteLine("=".PadRight(70, '='));
-            WriteLine("AVM Programming Exercise: Swap Curve");
-            WriteLine("=".PadRight(70, '='));
-
-            DateTime referenceDate = DateTime.Today;
-            WriteLine($"\nReference Date: {referenceDate:yyyy-MM-dd}");
-            WriteLine($"Notional: {Notional:N0}");
-
-            // Initialize services
-            var bootstrapper = new CurveBootstrapper();
-            var pricerService = new SwapPricerService();
-            var riskCalculator = new RiskCalculator(pricerService);
-
-            // Question 1: Build IBOR and Discount Curves using dual-curve methodology
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("QUESTION 1: Curve Construction (Dual-Curve Bootstrap)");
-            WriteLine("=".PadRight(70, '='));
-
-            var (iborCurve, discountCurve) = bootstrapper.BootstrapCurves(referenceDate, MarketQuotes);
-
-            WriteLine($"\nDiscount spread: {DiscountSpreadBps} bps over IBOR curve");
-            WriteLine("Float leg: semi-annual reset/pay");
-            WriteLine("Fixed leg: annual pay");
-            WriteLine("Day count: Actual/Actual");
-            WriteLine("Business day adjustment: None");
-            WriteLine("Spot lag: Zero");
-
-            PrintCurve(iborCurve, "IBOR (Forward) Curve");
-            PrintCurve(discountCurve, "Discount Curve");
-
-            // Question 2: 9Y Par Swap Pricing
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("QUESTION 2: 9Y Par Swap Pricing");
-            WriteLine("=".PadRight(70, '='));
-
-            DateTime swapEndDate = referenceDate.AddYears(SwapTenorYears);
-            var swap = new Swap(referenceDate, swapEndDate, Notional);
-
-            double parRate = pricerService.CalculateParRate(swap, iborCurve, referenceDate);
-            swap.FixedRate = parRate;
-
-            WriteLine($"\nSwap Details:");
-            WriteLine($"  Start Date: {swap.StartDate:yyyy-MM-dd}");
-            WriteLine($"  End Date: {swap.EndDate:yyyy-MM-dd}");
-            WriteLine($"  Tenor: {SwapTenorYears} years");
-            WriteLine($"  Notional: {Notional:N0}");
-
-            WriteLine($"\nResults:");
-            WriteLine($"  Par Swap Rate: {parRate * 100:F6}%");
-
-            var riskMetrics = riskCalculator.CalculateRiskMetrics(swap, MarketQuotes, referenceDate);
-            WriteLine($"  DV01: {riskMetrics.DV01:F2}");
-            WriteLine($"  Gamma: {riskMetrics.Gamma:F2}");
-
-            // Verify par swap has zero PV
-            double parSwapPV = pricerService.CalculateSwapPV(swap, iborCurve, referenceDate);
-            WriteLine($"\n  Verification - Par Swap PV: {parSwapPV:F2} (should be ~0)");
-
-            // Question 3: 3 Months Later - Accrual and Clean PV
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("QUESTION 3: Valuation 3 Months Later (Linear Interpolation)");
-            WriteLine("=".PadRight(70, '='));
-
-            DateTime valuationDate3M = referenceDate.AddMonths(3);
-            WriteLine($"\nValuation Date: {valuationDate3M:yyyy-MM-dd}");
-            WriteLine("(Assuming curve unchanged)");
-
-            // Shift curve reference date but keep same rates
-            var iborCurve3M = ShiftCurveReferenceDate(iborCurve, valuationDate3M);
-
-            var (cleanPV, fixedAccrual, floatAccrual) = pricerService.CalculateCleanPV(
-                swap, iborCurve3M, valuationDate3M);
-
-            double dirtyPV = pricerService.CalculateSwapPV(swap, iborCurve3M, valuationDate3M);
-
-            WriteLine($"\nResults:");
-            WriteLine($"  Fixed Leg Accrual: {fixedAccrual:F2}");
-            WriteLine($"  Float Leg Accrual: {floatAccrual:F2}");
-            WriteLine($"  Net Accrual (Fixed - Float): {fixedAccrual - floatAccrual:F2}");
-            WriteLine($"  Dirty PV: {dirtyPV:F2}");
-            WriteLine($"  Clean PV: {cleanPV:F2}");
-
-            // Question 4: Cubic Spline Interpolation
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("QUESTION 4: Cubic Spline Interpolation");
-            WriteLine("=".PadRight(70, '='));
-
-            WriteLine("\nBoundary conditions:");
-            WriteLine("  f(0) = f(6M)");
-            WriteLine("  f''(0) = f''(10Y) = 0");
-
-            // Build spline on ORIGINAL curve knots, then use for queries at shifted times
-            // "Curve unchanged" means spline shape stays the same
-            var iborCurve3MSpline = CreateSplineCurveForForwardDate(iborCurve, valuationDate3M);
-
-            var (cleanPVSpline, fixedAccrualSpline, floatAccrualSpline) = pricerService.CalculateCleanPV(
-                swap, iborCurve3MSpline, valuationDate3M);
-
-            double dirtyPVSpline = pricerService.CalculateSwapPV(swap, iborCurve3MSpline, valuationDate3M);
-
-            WriteLine($"\nResults (with Cubic Spline for IBOR curve):");
-            WriteLine($"  Fixed Leg Accrual: {fixedAccrualSpline:F2}");
-            WriteLine($"  Float Leg Accrual: {floatAccrualSpline:F2}");
-            WriteLine($"  Net Accrual (Fixed - Float): {fixedAccrualSpline - floatAccrualSpline:F2}");
-            WriteLine($"  Dirty PV: {dirtyPVSpline:F2}");
-            WriteLine($"  Clean PV: {cleanPVSpline:F2}");
-
-            // Diagnostic: Compare zero rates and forward rates
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("DIAGNOSTIC: Zero Rate Comparison (Linear vs Spline)");
-            WriteLine("=".PadRight(70, '='));
-            WriteLine($"{"Time",-8} {"Linear %",-12} {"Spline %",-12} {"Diff (bps)",-12}");
-            WriteLine(new string('-', 44));
-
-            double[] diagTimes = { 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 8.75 };
-            foreach (var t in diagTimes)
-            {
-                double linearRate = iborCurve3M.GetZeroRate(t);
-                double splineRate = iborCurve3MSpline.GetZeroRate(t);
-                double diffBps = (splineRate - linearRate) * 10000;
-                WriteLine($"{t,-8:F2} {linearRate * 100,-12:F6} {splineRate * 100,-12:F6} {diffBps,-12:F2}");
-            }
+        string report = BuildReport(DateTime.Today);
 
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("DIAGNOSTIC: Forward Rate Comparison (Linear vs Spline)");
-            WriteLine("=".PadRight(70, '='));
-            WriteLine($"{"Period",-12} {"Linear %",-12} {"Spline %",-12} {"Diff (bps)",-12}");
-            WriteLine(new string('-', 48));
+        // Emit the finished report once to both destinations
+        Console.Write(report);
+        File.WriteAllText(outputPath, report);
 
-            // Compare forward rates for each floating period (excluding first period which uses fixing)
-            double[] fwdStarts = { 0.25, 0.75, 1.25, 1.75, 2.25, 2.75, 3.25, 3.75, 4.25, 4.75, 5.25, 5.75, 6.25, 6.75, 7.25, 7.75, 8.25 };
-            foreach (var tStart in fwdStarts)
-            {
-                double tEnd = tStart + 0.5;
-                double linearFwd = iborCurve3M.GetForwardRate(tStart, tEnd);
-                double splineFwd = iborCurve3MSpline.GetForwardRate(tStart, tEnd);
-                double diffBps = (splineFwd - linearFwd) * 10000;
-                WriteLine($"{tStart:F2}-{tEnd:F2}    {linearFwd * 100,-12:F6} {splineFwd * 100,-12:F6} {diffBps,-12:F2}");
-            }
+        Console.WriteLine($"\nResults saved to: {outputPath}");
+    }
+
+    /// <summary>
+    /// Runs all exercise questions and returns the full results report.
+    /// </summary>
+    private static string BuildReport(DateTime referenceDate)
+    {
+        _report.Clear();
+
+        WriteLine(Separator);
+        WriteLine("AVM Programming Exercise: Swap Curve");
+        WriteLine(Separator);
+
+        WriteLine($"\nReference Date: {referenceDate:yyyy-MM-dd}");
+        WriteLine($"Notional: {Notional:N0}");
+
+        // Initialize services
+        var bootstrapper = new CurveBootstrapper();
+        var pricerService = new SwapPricerService();
+        var riskCalculator = new RiskCalculator(pricerService);
+
+        // Question 1: Build IBOR and Discount Curves using dual-curve methodology
+        WriteSection("QUESTION 1: Curve Construction (Dual-Curve Bootstrap)");
+
+        var (iborCurve, discountCurve) = bootstrapper.BootstrapCurves(referenceDate, MarketQuotes);
+
+        WriteLine($"\nDiscount spread: {DiscountSpreadBps} bps over IBOR curve");
+        WriteLines(CurveConventions);
+
+        PrintCurve(iborCurve, "IBOR (Forward) Curve");
+        PrintCurve(discountCurve, "Discount Curve");
+
+        // Question 2: 9Y Par Swap Pricing
+        WriteSection("QUESTION 2: 9Y Par Swap Pricing");
+
+        DateTime swapEndDate = referenceDate.AddYears(SwapTenorYears);
+        var swap = new Swap(referenceDate, swapEndDate, Notional);
+
+        double parRate = pricerService.CalculateParRate(swap, iborCurve, referenceDate);
+        swap.FixedRate = parRate;
+
+        WriteLine($"\nSwap Details:");
+        WriteLine($"  Start Date: {swap.StartDate:yyyy-MM-dd}");
+        WriteLine($"  End Date: {swap.EndDate:yyyy-MM-dd}");
+        WriteLine($"  Tenor: {SwapTenorYears} years");
+        WriteLine($"  Notional: {Notional:N0}");
+
+        WriteLine($"\nResults:");
+        WriteLine($"  Par Swap Rate: {parRate * 100:F6}%");
+
+        var riskMetrics = riskCalculator.CalculateRiskMetrics(swap, MarketQuotes, referenceDate);
+        WriteLine($"  DV01: {riskMetrics.DV01:F2}");
+        WriteLine($"  Gamma: {riskMetrics.Gamma:F2}");
+
+        // Verify par swap has zero PV
+        double parSwapPV = pricerService.CalculateSwapPV(swap, iborCurve, referenceDate);
+        WriteLine($"\n  Verification - Par Swap PV: {parSwapPV:F2} (should be ~0)");
+
+        // Question 3: 3 Months Later - Accrual and Clean PV
+        WriteSection("QUESTION 3: Valuation 3 Months Later (Linear Interpolation)");
+
+        DateTime valuationDate3M = referenceDate.AddMonths(3);
+        WriteLine($"\nValuation Date: {valuationDate3M:yyyy-MM-dd}");
+        WriteLine("(Assuming curve unchanged)");
 
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("Comparison: Linear vs Cubic Spline");
-            WriteLine("=".PadRight(70, '='));
-            WriteLine($"  Clean PV (Linear):       {cleanPV:F2}");
-            WriteLine($"  Clean PV (Cubic Spline): {cleanPVSpline:F2}");
-            WriteLine($"  Difference:              {cleanPVSpline - cleanPV:F2}");
+        // Shift curve reference date but keep same rates
+        var iborCurve3M = ShiftCurveReferenceDate(iborCurve, valuationDate3M);
 
-            WriteLine("\n" + "=".PadRight(70, '='));
-            WriteLine("Exercise Complete");
-            WriteLine("=".PadRight(70, '='));
+        var (cleanPV, fixedAccrual, floatAccrual) = pricerService.CalculateCleanPV(
+            swap, iborCurve3M, valuationDate3M);
+
+        double dirtyPV = pricerService.CalculateSwapPV(swap, iborCurve3M, valuationDate3M);
+
+        WriteValuationResults("Results", fixedAccrual, floatAccrual, dirtyPV, cleanPV);
+
+        // Question 4: Cubic Spline Interpolation
+        WriteSection("QUESTION 4: Cubic Spline Interpolation");
+
+        WriteLine("\nBoundary conditions:");
+        WriteLines(SplineBoundaryConditions);
+
+        // Build spline on ORIGINAL curve knots, then use for queries at shifted times
+        // "Curve unchanged" means spline shape stays the same
+        var iborCurve3MSpline = CreateSplineCurveForForwardDate(iborCurve, valuationDate3M);
+
+        var (cleanPVSpline, fixedAccrualSpline, floatAccrualSpline) = pricerService.CalculateCleanPV(
+            swap, iborCurve3MSpline, valuationDate3M);
+
+        double dirtyPVSpline = pricerService.CalculateSwapPV(swap, iborCurve3MSpline, valuationDate3M);
+
+        WriteValuationResults("Results (with Cubic Spline for IBOR curve)",
+            fixedAccrualSpline, floatAccrualSpline, dirtyPVSpline, cleanPVSpline);
+
+        // Diagnostic: Compare zero rates and forward rates
+        WriteSection("DIAGNOSTIC: Zero Rate Comparison (Linear vs Spline)");
+        WriteLine($"{"Time",-8} {"Linear %",-12} {"Spline %",-12} {"Diff (bps)",-12}");
+        WriteLine(new string('-', 44));
+
+        double[] diagTimes = { 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 8.75 };
+        foreach (var t in diagTimes)
+        {
+            double linearRate = iborCurve3M.GetZeroRate(t);
+            double splineRate = iborCurve3MSpline.GetZeroRate(t);
+            double diffBps = (splineRate - linearRate) * 10000;
+            WriteLine($"{t,-8:F2} {linearRate * 100,-12:F6} {splineRate * 100,-12:F6} {diffBps,-12:F2}");
         }
 
-        Console.WriteLine($"\nResults saved to: {outputPath}");
+        WriteSection("DIAGNOSTIC: Forward Rate Comparison (Linear vs Spline)");
+        WriteLine($"{"Period",-12} {"Linear %",-12} {"Spline %",-12} {"Diff (bps)",-12}");
+        WriteLine(new string('-', 48));
+
+        // Compare forward rates for each floating period (excluding first period which uses fixing)
+        double[] fwdStarts = { 0.25, 0.75, 1.25, 1.75, 2.25, 2.75, 3.25, 3.75, 4.25, 4.75, 5.25, 5.75, 6.25, 6.75, 7.25, 7.75, 8.25 };
+        foreach (var tStart in fwdStarts)
+        {
+            double tEnd = tStart + 0.5;
+            double linearFwd = iborCurve3M.GetForwardRate(tStart, tEnd);
+            double splineFwd = iborCurve3MSpline.GetForwardRate(tStart, tEnd);
+            double diffBps = (splineFwd - linearFwd) * 10000;
+            WriteLine($"{tStart:F2}-{tEnd:F2}    {linearFwd * 100,-12:F6} {splineFwd * 100,-12:F6} {diffBps,-12:F2}");
+        }
+
+        WriteSection("Comparison: Linear vs Cubic Spline");
+        WriteLine($"  Clean PV (Linear):       {cleanPV:F2}");
+        WriteLine($"  Clean PV (Cubic Spline): {cleanPVSpline:F2}");
+        WriteLine($"  Difference:              {cleanPVSpline - cleanPV:F2}");
+
+        WriteSection("Exercise Complete");
+
+        return _report.ToString();
     }
 
     /// <summary>
-    /// Writes to both console and file.
+    /// Appends a line to the report.
     /// </summary>
     private static void WriteLine(string text)
     {
-        Console.WriteLine(text);
-        _fileWriter?.WriteLine(text);
+        _report.AppendLine(text);
+    }
+
+    /// <summary>
+    /// Appends several lines to the report.
+    /// </summary>
+    private static void WriteLines(IEnumerable<string> lines)
+    {
+        foreach (var line in lines)
+            WriteLine(line);
+    }
+
+    /// <summary>
+    /// Appends a section heading framed by separators.
+    /// </summary>
+    private static void WriteSection(string title)
+    {
+        WriteLine("\n" + Separator);
+        WriteLine(title);
+        WriteLine(Separator);
+    }
+
+    /// <summary>
+    /// Appends the accrual and PV results of a forward valuation.
+    /// </summary>
+    private static void WriteValuationResults(string heading, double fixedAccrual, double floatAccrual,
+        double dirtyPV, double cleanPV)
+    {
+        WriteLine($"\n{heading}:");
+        WriteLine($"  Fixed Leg Accrual: {fixedAccrual:F2}");
+        WriteLine($"  Float Leg Accrual: {floatAccrual:F2}");
+        WriteLine($"  Net Accrual (Fixed - Float): {fixedAccrual - floatAccrual:F2}");
+        WriteLine($"  Dirty PV: {dirtyPV:F2}");
+        WriteLine($"  Clean PV: {cleanPV:F2}");
     }
 
     /// <summary>
-    /// Prints curve data to both console and file.
+    /// Prints curve data to the report.
     /// </summary>
     private static void PrintCurve(Curve curve, string name)
     {
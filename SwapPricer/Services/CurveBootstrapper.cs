@@ -1,3 +1,4 @@
+using System.Runtime.CompilerServices;
 using SwapPricer.Models;
 using SwapPricer.Utils;
 
@@ -54,73 +55,121 @@ public class CurveBootstrapper
         return (iborCurve, discountCurve);
     }
 
+    /// <summary>
+    /// Accrual schedule expressed as year fractions from the reference date.
+    /// </summary>
+    private sealed record AccrualSchedule(double[] Start, double[] End, double[] Tau);
+
     /// <summary>
     /// Bootstraps a single IBOR zero rate using dual-curve methodology.
-    /// Uses Newton-Raphson to find the rate that makes swap NPV = 0.
+    /// Uses the secant method (Newton-Raphson with a reused finite-difference slope)
+    /// to find the rate that makes swap NPV = 0.
+    /// Throws InvalidOperationException if the solve does not converge.
     /// </summary>
     private double BootstrapDualCurve(Curve iborCurve, Curve discountCurve,
         DateTime referenceDate, double tenorYears, double parRate, double spread)
     {
-        // Generate payment schedules
+        // Generate payment schedules once; only the rate guess changes between iterations
         int tenorMonths = (int)(tenorYears * 12);
         DateTime endDate = referenceDate.AddMonths(tenorMonths);
-        var fixedPayDates = DateUtils.GeneratePaymentDates(referenceDate, endDate, 12);  // Annual
-        var floatPayDates = DateUtils.GeneratePaymentDates(referenceDate, endDate, 6);   // Semi-annual
+        var fixedLeg = BuildSchedule(referenceDate,
+            DateUtils.GeneratePaymentDates(referenceDate, endDate, 12));  // Annual
+        var floatLeg = BuildSchedule(referenceDate,
+            DateUtils.GeneratePaymentDates(referenceDate, endDate, 6));   // Semi-annual
 
-        // Initial guess: use par rate as starting point
-        double iborRate = parRate;
+        // Rates from the existing curve points are fixed while solving for the new tenor
+        double[] iborStartRates = SampleCurve(iborCurve, floatLeg.Start, tenorYears);
+        double[] iborEndRates = SampleCurve(iborCurve, floatLeg.End, tenorYears);
+        double[] discFixedRates = SampleCurve(discountCurve, fixedLeg.End, tenorYears);
 
-        // Newton-Raphson iteration
-        for (int iter = 0; iter < MaxIterations; iter++)
+        // Discount DF = IBOR DF * exp(-spread * t); the spread factor only depends on the payment time
+        double[] floatSpreadFactors = GetSpreadFactors(floatLeg.End, spread);
+
+        // Swap NPV for a trial IBOR zero rate at the new tenor
+        double Npv(double iborRate)
         {
-            double discRate = iborRate + spread;
+            double floatPV = CalculateFloatLegPV(floatLeg, iborStartRates, iborEndRates, floatSpreadFactors,
+                iborRate, tenorYears);
+            double fixedPV = CalculateFixedLegPV(fixedLeg, discFixedRates,
+                parRate, iborRate + spread, tenorYears);
+            return floatPV - fixedPV;
+        }
 
-            // Calculate swap NPV with current guess
-            double floatPV = CalculateFloatLegPV(iborCurve, discountCurve, referenceDate,
-                floatPayDates, iborRate, discRate, tenorYears);
-            double fixedPV = CalculateFixedLegPV(discountCurve, referenceDate,
-                fixedPayDates, parRate, discRate, tenorYears);
+        // Initial guess: use par rate as starting point; a 1bp bump seeds the first secant slope
+        return RootFinder.Secant(Npv, parRate + 0.0001, parRate, Tolerance, MaxIterations);
+    }
 
-            double npv = floatPV - fixedPV;
+    /// <summary>
+    /// Converts payment dates into accrual start/end times and year fractions.
+    /// </summary>
+    private static AccrualSchedule BuildSchedule(DateTime referenceDate, List<DateTime> payDates)
+    {
+        int n = payDates.Count;
+        var start = new double[n];
+        var end = new double[n];
+        var tau = new double[n];
+        DateTime prevDate = referenceDate;
 
-            if (Math.Abs(npv) < Tolerance)
-            {
-                return iborRate;
-            }
+        for (int i = 0; i < n; i++)
+        {
+            start[i] = DateUtils.YearFraction(referenceDate, prevDate);
+            end[i] = DateUtils.YearFraction(referenceDate, payDates[i]);
+            tau[i] = DateUtils.YearFraction(prevDate, payDates[i]);
+            prevDate = payDates[i];
+        }
+
+        return new AccrualSchedule(start, end, tau);
+    }
+
+    /// <summary>
+    /// Samples zero rates from the existing curve at the given times.
+    /// Times at or beyond the new tenor are left at zero; they use the rate being bootstrapped.
+    /// </summary>
+    private static double[] SampleCurve(Curve curve, double[] times, double newTenor)
+    {
+        var rates = new double[times.Length];
+
+        for (int i = 0; i < times.Length; i++)
+        {
+            double t = times[i];
+            if (t >= 0.001 && t < newTenor - 0.001)
+                rates[i] = curve.GetZeroRate(t);
+        }
 
-            // Numerical derivative for Newton-Raphson
-            double bump = 0.0001;
-            double floatPVUp = CalculateFloatLegPV(iborCurve, discountCurve, referenceDate,
-                floatPayDates, iborRate + bump, discRate + bump, tenorYears);
-            double fixedPVUp = CalculateFixedLegPV(discountCurve, referenceDate,
-                fixedPayDates, parRate, discRate + bump, tenorYears);
-            double npvUp = floatPVUp - fixedPVUp;
+        return rates;
+    }
 
-            double derivative = (npvUp - npv) / bump;
-            if (Math.Abs(derivative) < 1e-15)
-                break;
+    /// <summary>
+    /// Computes exp(-spread * t) for each time, converting IBOR DFs into discount DFs.
+    /// </summary>
+    private static double[] GetSpreadFactors(double[] times, double spread)
+    {
+        var factors = new double[times.Length];
 
-            iborRate = iborRate - npv / derivative;
+        for (int i = 0; i < times.Length; i++)
+        {
+            factors[i] = times[i] < 0.001 ? 1.0 : Math.Exp(-spread * times[i]);
         }
 
-        return iborRate;
+        return factors;
     }
 
     /// <summary>
     /// Calculates floating leg PV using forward rates from IBOR curve, discounted with discount curve.
+    /// The discount curve sits at IBOR + spread, so discount DFs are IBOR DFs scaled by the spread factors.
     /// </summary>
-    private double CalculateFloatLegPV(Curve iborCurve, Curve discountCurve,
-        DateTime referenceDate, List<DateTime> payDates,
-        double newIborRate, double newDiscRate, double newTenor)
+    private static double CalculateFloatLegPV(AccrualSchedule floatLeg,
+        double[] iborStartRates, double[] iborEndRates, double[] spreadFactors,
+        double newIborRate, double newTenor)
     {
         double pv = 0.0;
-        DateTime prevDate = referenceDate;
 
-        foreach (var payDate in payDates)
+        for (int i = 0; i < floatLeg.End.Length; i++)
         {
-            double tStart = DateUtils.YearFraction(referenceDate, prevDate);
-            double tEnd = DateUtils.YearFraction(referenceDate, payDate);
-            double tau = DateUtils.YearFraction(prevDate, payDate);
+            double tStart = floatLeg.Start[i];
+            double tEnd = floatLeg.End[i];
+            double tau = floatLeg.Tau[i];
+            double rtEnd = GetRateTime(tEnd, iborEndRates[i], newIborRate, newTenor);
 
             // Get forward rate from IBOR curve
             double forwardRate;
@@ -129,21 +178,18 @@ public class CurveBootstrapper
                 // First period: forward rate = zero rate at period end
                 forwardRate = tEnd >= newTenor - 0.001
                     ? newIborRate
-                    : iborCurve.GetZeroRate(tEnd);
+                    : iborEndRates[i];
             }
             else
             {
-                // Forward rate from zero rates
-                double dfStart = GetDiscountFactor(iborCurve, tStart, newIborRate, newTenor);
-                double dfEnd = GetDiscountFactor(iborCurve, tEnd, newIborRate, newTenor);
-                forwardRate = (dfStart / dfEnd - 1.0) / tau;
+                // Forward rate from zero rates: DF_start / DF_end - 1 = expm1(r_end * t_end - r_start * t_start)
+                double rtStart = GetRateTime(tStart, iborStartRates[i], newIborRate, newTenor);
+                forwardRate = MathUtils.ExpM1(rtEnd - rtStart) / tau;
             }
 
             // Discount using discount curve
-            double dfDisc = GetDiscountFactor(discountCurve, tEnd, newDiscRate, newTenor);
+            double dfDisc = Math.Exp(-rtEnd) * spreadFactors[i];
             pv += forwardRate * tau * dfDisc;
-
-            prevDate = payDate;
         }
 
         return pv;
@@ -152,21 +198,15 @@ public class CurveBootstrapper
     /// <summary>
     /// Calculates fixed leg PV discounted with discount curve.
     /// </summary>
-    private double CalculateFixedLegPV(Curve discountCurve, DateTime referenceDate,
-        List<DateTime> payDates, double fixedRate, double newDiscRate, double newTenor)
+    private static double CalculateFixedLegPV(AccrualSchedule fixedLeg, double[] discEndRates,
+        double fixedRate, double newDiscRate, double newTenor)
     {
         double pv = 0.0;
-        DateTime prevDate = referenceDate;
 
-        foreach (var payDate in payDates)
+        for (int i = 0; i < fixedLeg.End.Length; i++)
         {
-            double t = DateUtils.YearFraction(referenceDate, payDate);
-            double tau = DateUtils.YearFraction(prevDate, payDate);
-
-            double df = GetDiscountFactor(discountCurve, t, newDiscRate, newTenor);
-            pv += fixedRate * tau * df;
-
-            prevDate = payDate;
+            double df = GetDiscountFactor(fixedLeg.End[i], discEndRates[i], newDiscRate, newTenor);
+            pv += fixedRate * fixedLeg.Tau[i] * df;
         }
 
         return pv;
@@ -176,24 +216,25 @@ public class CurveBootstrapper
     /// Gets discount factor, using the new rate if at or beyond the new tenor point.
     /// Uses continuous compounding: DF = exp(-r * t)
     /// </summary>
-    private double GetDiscountFactor(Curve curve, double t, double newRate, double newTenor)
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
+    private static double GetDiscountFactor(double t, double curveRate, double newRate, double newTenor)
+    {
+        return Math.Exp(-GetRateTime(t, curveRate, newRate, newTenor));
+    }
+
+    /// <summary>
+    /// Gets r(t) * t (i.e. -ln DF), using the new rate if at or beyond the new tenor point.
+    /// </summary>
+    [MethodImpl(MethodImplOptions.AggressiveInlining)]
+    private static double GetRateTime(double t, double curveRate, double newRate, double newTenor)
     {
         if (t < 0.001)
-            return 1.0;
+            return 0.0;
 
-        double rate;
-        if (t >= newTenor - 0.001)
-        {
-            // Use the new rate being bootstrapped
-            rate = newRate;
-        }
-        else
-        {
-            // Use existing curve
-            rate = curve.GetZeroRate(t);
-        }
+        // Use the new rate being bootstrapped at or beyond the new tenor, else the existing curve
+        double rate = t >= newTenor - 0.001 ? newRate : curveRate;
 
-        return Math.Exp(-rate * t);
+        return rate * t;
     }
 
     /// <summary>
@@ -201,14 +242,6 @@ public class CurveBootstrapper
     /// </summary>
     public Curve CreateDiscountCurve(Curve iborCurve, double spreadBps)
     {
-        double spread = spreadBps / 10000.0;
-        var discountCurve = new Curve(iborCurve.ReferenceDate);
-
-        for (int i = 0; i < iborCurve.Times.Count; i++)
-        {
-            discountCurve.AddPoint(iborCurve.Times[i], iborCurve.ZeroRates[i] + spread);
-        }
-
-        return discountCurve;
+        return iborCurve.ShiftParallel(spreadBps);
     }
 }
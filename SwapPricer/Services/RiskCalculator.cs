@@ -29,25 +29,12 @@ public class RiskCalculator
     {
         const double bumpBps = 0.0001; // 1bp = 0.01% = 0.0001
 
-        // Base curves and PV (only IBOR curve needed; discount is derived from IBOR + spread)
-        var (iborBase, _) = _bootstrapper.BootstrapCurves(referenceDate, marketQuotes);
-        double pvBase = _pricerService.CalculateSwapPV(swap, iborBase, referenceDate);
-
-        // Shocked quotes: bump par swap rates by +1bp, keep fixing unchanged
-        var shockedQuotes = marketQuotes.Select(q =>
-            q.IsFixing
-                ? q  // Keep 6M fixing unchanged
-                : new MarketQuote(q.TenorYears, q.Rate + bumpBps, q.IsFixing)
-        ).ToList();
-
-        // Re-bootstrap with shocked quotes
-        var (iborShocked, _) = _bootstrapper.BootstrapCurves(referenceDate, shockedQuotes);
-        double pvShocked = _pricerService.CalculateSwapPV(swap, iborShocked, referenceDate);
+        var pvs = PriceParShiftScenarios(swap, marketQuotes, referenceDate, 0.0, bumpBps);
+        double pvBase = pvs[0];
+        double pvShocked = pvs[1];
 
         // DV01 = change in PV for +1bp shock
-        double dv01 = pvShocked - pvBase;
-
-        return dv01;
+        return pvShocked - pvBase;
     }
 
     /// <summary>
@@ -58,32 +45,13 @@ public class RiskCalculator
     {
         const double bumpBps = 0.0001; // 1bp
 
-        // Base curves and PV
-        var (iborBase, _) = _bootstrapper.BootstrapCurves(referenceDate, marketQuotes);
-        double pvBase = _pricerService.CalculateSwapPV(swap, iborBase, referenceDate);
-
-        // Shocked up quotes
-        var shockedUpQuotes = marketQuotes.Select(q =>
-            q.IsFixing
-                ? q
-                : new MarketQuote(q.TenorYears, q.Rate + bumpBps, q.IsFixing)
-        ).ToList();
-        var (iborUp, _) = _bootstrapper.BootstrapCurves(referenceDate, shockedUpQuotes);
-        double pvUp = _pricerService.CalculateSwapPV(swap, iborUp, referenceDate);
-
-        // Shocked down quotes
-        var shockedDownQuotes = marketQuotes.Select(q =>
-            q.IsFixing
-                ? q
-                : new MarketQuote(q.TenorYears, q.Rate - bumpBps, q.IsFixing)
-        ).ToList();
-        var (iborDown, _) = _bootstrapper.BootstrapCurves(referenceDate, shockedDownQuotes);
-        double pvDown = _pricerService.CalculateSwapPV(swap, iborDown, referenceDate);
+        var pvs = PriceParShiftScenarios(swap, marketQuotes, referenceDate, 0.0, bumpBps, -bumpBps);
+        double pvBase = pvs[0];
+        double pvUp = pvs[1];
+        double pvDown = pvs[2];
 
         // Gamma = convexity measure
-        double gamma = pvUp - 2 * pvBase + pvDown;
-
-        return gamma;
+        return pvUp - 2 * pvBase + pvDown;
     }
 
     /// <summary>
@@ -93,12 +61,49 @@ public class RiskCalculator
 
     /// <summary>
     /// Calculates all risk metrics at once.
+    /// The base, +1bp and -1bp curves are bootstrapped once and shared by DV01 and Gamma.
     /// </summary>
     public RiskMetrics CalculateRiskMetrics(Swap swap, List<MarketQuote> marketQuotes, DateTime referenceDate)
     {
-        double dv01 = CalculateDV01(swap, marketQuotes, referenceDate);
-        double gamma = CalculateGamma(swap, marketQuotes, referenceDate);
+        const double bumpBps = 0.0001; // 1bp
+
+        var pvs = PriceParShiftScenarios(swap, marketQuotes, referenceDate, 0.0, bumpBps, -bumpBps);
+        double pvBase = pvs[0];
+        double pvUp = pvs[1];
+        double pvDown = pvs[2];
+
+        double dv01 = pvUp - pvBase;
+        double gamma = pvUp - 2 * pvBase + pvDown;
 
         return new RiskMetrics(dv01, gamma);
     }
+
+    /// <summary>
+    /// Prices the swap under a batch of parallel par-rate shifts in one pass.
+    /// For each shift the par swap rates are moved (6M fixing unchanged), the curves re-bootstrapped,
+    /// and the swap repriced. Only the IBOR curve is needed; discount is derived from IBOR + spread.
+    /// </summary>
+    private double[] PriceParShiftScenarios(Swap swap, List<MarketQuote> marketQuotes, DateTime referenceDate,
+        params double[] shifts)
+    {
+        var pvs = new double[shifts.Length];
+        var shockedQuotes = new List<MarketQuote>(marketQuotes.Count);
+
+        for (int s = 0; s < shifts.Length; s++)
+        {
+            // Reuse one quote buffer across scenarios
+            shockedQuotes.Clear();
+            foreach (var q in marketQuotes)
+            {
+                shockedQuotes.Add(q.IsFixing || shifts[s] == 0.0
+                    ? q  // Keep 6M fixing unchanged
+                    : new MarketQuote(q.TenorYears, q.Rate + shifts[s], q.IsFixing));
+            }
+
+            var (iborCurve, _) = _bootstrapper.BootstrapCurves(referenceDate, shockedQuotes);
+            pvs[s] = _pricerService.CalculateSwapPV(swap, iborCurve, referenceDate);
+        }
+
+        return pvs;
+    }
 }
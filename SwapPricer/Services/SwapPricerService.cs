@@ -24,45 +24,33 @@ public class SwapPricerService
     }
 
     /// <summary>
-    /// Gets the IBOR DF from the IBOR curve.
-    /// IBOR_DF = exp(-IBOR_rate × t)
+    /// Gets IBOR_rate × t from the IBOR curve, i.e. -ln(IBOR_DF).
     /// </summary>
-    private double GetIborDF(Curve iborCurve, double t)
+    private double GetIborRateTime(Curve iborCurve, double t)
     {
-        double iborRate = iborCurve.GetZeroRate(t);
-        return Math.Exp(-iborRate * t);
+        return iborCurve.GetZeroRate(t) * t;
     }
 
     /// <summary>
     /// Calculates forward rate from IBOR DFs.
+    /// DF_start / DF_end - 1 = expm1(r_end × t_end - r_start × t_start), which avoids cancellation.
     /// </summary>
     private double GetForwardRateFromIborCurve(Curve iborCurve, double tStart, double tEnd)
     {
-        double iborDfStart = GetIborDF(iborCurve, tStart);
-        double iborDfEnd = GetIborDF(iborCurve, tEnd);
+        double iborRtStart = GetIborRateTime(iborCurve, tStart);
+        double iborRtEnd = GetIborRateTime(iborCurve, tEnd);
         double tau = tEnd - tStart;
-        return (iborDfStart / iborDfEnd - 1.0) / tau;
+        return MathUtils.ExpM1(iborRtEnd - iborRtStart) / tau;
     }
 
     /// <summary>
     /// Calculates the present value of the fixed leg.
+    /// Every fixed cash flow is Notional × FixedRate × day_fraction, so PV = Notional × FixedRate × Annuity.
     /// </summary>
     public double CalculateFixedLegPV(Swap swap, Curve iborCurve, DateTime valuationDate)
     {
-        double pv = 0.0;
-        var cashFlows = swap.GetFixedLegCashFlows();
-
-        foreach (var cf in cashFlows)
-        {
-            if (cf.PaymentDate <= valuationDate)
-                continue; // Already paid
-
-            double t = DateUtils.YearFraction(iborCurve.ReferenceDate, cf.PaymentDate);
-            double df = GetDiscountDFFromIborCurve(iborCurve, t);
-            pv += cf.Amount * df;
-        }
-
-        return pv;
+        double annuity = CalculateFixedAnnuity(swap, iborCurve, valuationDate);
+        return swap.Notional * swap.FixedRate * annuity;
     }
 
     /// <summary>
@@ -74,6 +62,10 @@ public class SwapPricerService
         double pv = 0.0;
         var periods = swap.GetFloatLegPeriods();
 
+        // The IBOR r × t at one period's end is reused as the start of the next period
+        double prevTEnd = double.NaN;
+        double prevIborRtEnd = 0.0;
+
         foreach (var period in periods)
         {
             if (period.PaymentDate <= valuationDate)
@@ -83,6 +75,7 @@ public class SwapPricerService
 
             // Forward rate for the period
             double forwardRate;
+            double? iborRtPay = null;
 
             // Check if this is the first period (0-6M) which uses the market fixing
             double originalTEnd = DateUtils.YearFraction(swap.StartDate, period.AccrualEnd);
@@ -94,21 +87,25 @@ public class SwapPricerService
             else
             {
                 // Calculate forward rate from IBOR curve
-                double tStart = DateUtils.YearFraction(iborCurve.ReferenceDate, period.AccrualStart);
+                double tStart = Math.Max(DateUtils.YearFraction(iborCurve.ReferenceDate, period.AccrualStart), 0.0001);
                 double tEnd = DateUtils.YearFraction(iborCurve.ReferenceDate, period.AccrualEnd);
 
-                if (tStart < 0.0001)
-                {
-                    forwardRate = GetForwardRateFromIborCurve(iborCurve, 0.0001, tEnd);
-                }
-                else
-                {
-                    forwardRate = GetForwardRateFromIborCurve(iborCurve, tStart, tEnd);
-                }
+                double iborRtStart = tStart == prevTEnd ? prevIborRtEnd : GetIborRateTime(iborCurve, tStart);
+                double iborRtEnd = GetIborRateTime(iborCurve, tEnd);
+                forwardRate = MathUtils.ExpM1(iborRtEnd - iborRtStart) / (tEnd - tStart);
+
+                prevTEnd = tEnd;
+                prevIborRtEnd = iborRtEnd;
+
+                if (period.PaymentDate == period.AccrualEnd)
+                    iborRtPay = iborRtEnd;
             }
 
-            // Discount using DF derived from IBOR curve + spread
-            double df = GetDiscountDFFromIborCurve(iborCurve, tPay);
+            // Discount using DF derived from IBOR curve + spread.
+            // Reuse the IBOR r × t when paid at accrual end: DF = exp(-(r × t + spread × t)).
+            double df = iborRtPay.HasValue
+                ? Math.Exp(-(iborRtPay.Value + DiscountSpread * tPay))
+                : GetDiscountDFFromIborCurve(iborCurve, tPay);
             double amount = swap.Notional * forwardRate * period.DayFraction;
             pv += amount * df;
         }
@@ -147,23 +144,15 @@ public class SwapPricerService
     public double CalculateFixedAnnuity(Swap swap, Curve iborCurve, DateTime valuationDate)
     {
         double annuity = 0.0;
-        var payDates = DateUtils.GeneratePaymentDates(swap.StartDate, swap.EndDate, swap.FixedFrequencyMonths);
-        DateTime prevDate = swap.StartDate;
 
-        foreach (var payDate in payDates)
+        foreach (var cf in swap.GetFixedLegCashFlows())
         {
-            if (payDate <= valuationDate)
-            {
-                prevDate = payDate;
-                continue;
-            }
+            if (cf.PaymentDate <= valuationDate)
+                continue; // Already paid
 
-            double t = DateUtils.YearFraction(iborCurve.ReferenceDate, payDate);
-            double tau = DateUtils.YearFraction(prevDate, payDate);
+            double t = DateUtils.YearFraction(iborCurve.ReferenceDate, cf.PaymentDate);
             double df = GetDiscountDFFromIborCurve(iborCurve, t);
-
-            annuity += df * tau;
-            prevDate = payDate;
+            annuity += df * cf.DayFraction;
         }
 
         return annuity;
@@ -0,0 +1,25 @@
+namespace SwapPricer.Utils;
+
+/// <summary>
+/// Numerical helpers not provided by System.Math on .NET 6.
+/// </summary>
+public static class MathUtils
+{
+    /// <summary>
+    /// Computes exp(x) - 1 without the cancellation of Math.Exp(x) - 1 for small x.
+    /// Uses Kahan's correction: (u - 1) * x / ln(u) with u = exp(x).
+    /// </summary>
+    public static double ExpM1(double x)
+    {
+        double u = Math.Exp(x);
+
+        if (u == 1.0)
+            return x;
+
+        double um1 = u - 1.0;
+        if (um1 == -1.0 || double.IsPositiveInfinity(u))
+            return um1;
+
+        return um1 * x / Math.Log(u);
+    }
+}
@@ -0,0 +1,39 @@
+namespace SwapPricer.Utils;
+
+/// <summary>
+/// One-dimensional root finding.
+/// </summary>
+public static class RootFinder
+{
+    /// <summary>
+    /// Finds a root of f using the secant method.
+    /// Each iteration costs a single evaluation of f; the slope comes from the previous iterate.
+    /// </summary>
+    /// <param name="f">Function whose root is sought</param>
+    /// <param name="x0">Auxiliary starting point used only for the first slope</param>
+    /// <param name="x1">Initial guess</param>
+    /// <param name="tolerance">Converged when |f(x)| is below this value</param>
+    /// <param name="maxIterations">Maximum number of iterations</param>
+    public static double Secant(Func<double, double> f, double x0, double x1, double tolerance, int maxIterations)
+    {
+        double f0 = f(x0);
+
+        for (int iter = 0; iter < maxIterations; iter++)
+        {
+            double f1 = f(x1);
+
+            if (Math.Abs(f1) < tolerance)
+                return x1;
+
+            double slope = (f1 - f0) / (x1 - x0);
+            if (double.IsNaN(slope) || Math.Abs(slope) < 1e-15)
+                throw new InvalidOperationException($"Secant method stalled at x = {x1} (degenerate slope).");
+
+            x0 = x1;
+            f0 = f1;
+            x1 = x1 - f1 / slope;
+        }
+
+        throw new InvalidOperationException($"Secant method did not converge within {maxIterations} iterations.");
+    }
+}